@@ -26,24 +26,239 @@ Note:
     Complete rewrite with async support.
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from enum import Enum, auto
+from enum import IntEnum
 from pathlib import Path
-from typing import Callable, List, Optional, Protocol
+from typing import (
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+import bisect
 import hashlib
+import heapq
+import mmap
+import os
+import queue
+import re
+import sys
+import threading
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+_DOWN_MARKER = b"-- DOWN --"
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+_DEPENDS_PREFIX = "-- DEPENDS:"
+_PARALLEL_PARSE_THRESHOLD = 64
+
+# Scanner states for _find_down_marker, and the bytes that end each one.
+# A dollar-quoted string ends with the same ``$tag$`` that opened it.
+(
+    _NORMAL,
+    _SINGLE_QUOTE,
+    _DOUBLE_QUOTE,
+    _LINE_COMMENT,
+    _BLOCK_COMMENT,
+    _DOLLAR_QUOTE,
+) = range(6)
+_STATE_END = {
+    _SINGLE_QUOTE: b"'",
+    _DOUBLE_QUOTE: b'"',
+    _LINE_COMMENT: b"\n",
+    _BLOCK_COMMENT: b"*/",
+}
+_DASH, _SLASH, _QUOTE, _DQUOTE, _BACKSLASH, _DOLLAR = b"-/'\"\\$"
+_SPECIAL = re.compile(rb"""[-/'"$]""")
+_DOLLAR_TAG = re.compile(rb"\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$")
+_IDENT_BYTES = frozenset(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$"
+)
+
+
+def _new_hasher(data: bytes = b""):
+    """
+    Create a checksum hasher for migration content.
+
+    The checksum only detects drift between a migration file and its
+    recorded state, so a fast non-cryptographic hash is preferred.
+
+    Args:
+        data: Optional initial bytes to feed the hasher.
+
+    Returns:
+        A hasher exposing ``update`` and ``hexdigest``.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64(data)
+    return hashlib.sha256(data)
+
+
+def _strip_bounds(buf, start: int, end: int) -> Tuple[int, int]:
+    """Narrow ``[start, end)`` to exclude surrounding ASCII whitespace."""
+    while start < end and buf[start] in _WHITESPACE:
+        start += 1
+    while end > start and buf[end - 1] in _WHITESPACE:
+        end -= 1
+    return start, end
+
+
+def _find_down_marker(buf) -> int:
+    """
+    Find the first ``-- DOWN --`` marker outside quotes and comments.
+
+    Scans the buffer with a small state machine and stops at the first
+    real marker, so markers inside string literals, quoted identifiers,
+    PostgreSQL dollar-quoted bodies (``$$ ... $$``, ``$fn$ ... $fn$``) or
+    comments are ignored. A backslash escapes the next character inside
+    quotes, as in MySQL (``'a\\'b'``). If that reading finds no marker,
+    the scan is repeated with standard SQL quoting, where a backslash is
+    an ordinary character (``'C:\\'``).
+
+    If neither scan finds a marker, the first occurrence anywhere in the
+    buffer is used, so every file that contains ``-- DOWN --`` at all is
+    accepted; the scans only decide which occurrence separates the
+    sections.
+
+    Args:
+        buf: Migration file contents as a bytes-like object.
+
+    Returns:
+        Offset of the marker, or -1 if there is none.
+    """
+    split = _scan_for_marker(buf, backslash_escapes=True)
+    if split == -1:
+        split = _scan_for_marker(buf, backslash_escapes=False)
+    if split == -1:
+        split = buf.find(_DOWN_MARKER)
+    return split
+
+
+def _scan_for_marker(buf, backslash_escapes: bool) -> int:
+    """
+    Run one pass of the ``-- DOWN --`` state machine over ``buf``.
+
+    The byte-level scanning is done by ``re`` and ``find`` in C; the
+    Python loop only runs once per quote, comment or dash.
+
+    Args:
+        buf: Migration file contents as a bytes-like object.
+        backslash_escapes: Whether a backslash escapes a closing quote.
+
+    Returns:
+        Offset of the marker, or -1 if there is none.
+    """
+    marker_len = len(_DOWN_MARKER)
+    state = _NORMAL
+    dollar_tag = b""
+    size = len(buf)
+    i = 0
+
+    while i < size:
+        if state != _NORMAL:
+            end = dollar_tag if state == _DOLLAR_QUOTE else _STATE_END[state]
+            start = i
+            i = buf.find(end, i)
+            if backslash_escapes and state in (_SINGLE_QUOTE, _DOUBLE_QUOTE):
+                while i != -1 and _escaped(buf, start, i):
+                    i = buf.find(end, i + 1)
+            if i == -1:
+                return -1
+            i += len(end)
+            state = _NORMAL
+            continue
+
+        match = _SPECIAL.search(buf, i)
+        if match is None:
+            return -1
+        i = match.start()
+        c = buf[i]
+        if c == _DASH:
+            if buf[i:i + marker_len] == _DOWN_MARKER:
+                return i
+            if buf[i + 1:i + 2] == b"-":
+                state = _LINE_COMMENT
+                i += 1
+        elif c == _QUOTE:
+            state = _SINGLE_QUOTE
+        elif c == _DQUOTE:
+            state = _DOUBLE_QUOTE
+        elif c == _DOLLAR:
+            # ``$`` inside an identifier (``a$b``) never opens a quote.
+            tag = None
+            if not i or buf[i - 1] not in _IDENT_BYTES:
+                tag = _DOLLAR_TAG.match(buf, i)
+            if tag is not None:
+                dollar_tag = tag.group()
+                state = _DOLLAR_QUOTE
+                i = tag.end()
+                continue
+        elif buf[i + 1:i + 2] == b"*":
+            state = _BLOCK_COMMENT
+            i += 1
+        i += 1
+
+    return -1
+
+
+def _escaped(buf, start: int, pos: int) -> bool:
+    """Whether ``buf[pos]`` follows an odd run of backslashes after ``start``."""
+    run = pos
+    while run > start and buf[run - 1] == _BACKSLASH:
+        run -= 1
+    return (pos - run) % 2 == 1
+
+
+def _parse_depends(up_sql: str) -> List[str]:
+    """
+    Read ``-- DEPENDS: id1, id2`` directives from a migration header.
 
+    Only the leading comment block is inspected; the first SQL statement
+    ends the header.
 
-class MigrationStatus(Enum):
+    Args:
+        up_sql: SQL to apply the migration.
+
+    Returns:
+        IDs of the migrations this one depends on.
+    """
+    depends_on = []
+    for line in up_sql.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith("--"):
+            break
+        if line.startswith(_DEPENDS_PREFIX):
+            ids = line[len(_DEPENDS_PREFIX):].replace(",", " ").split()
+            depends_on.extend(ids)
+    return depends_on
+
+
+class MigrationStatus(IntEnum):
     """Status of a migration."""
 
-    PENDING = auto()
-    APPLIED = auto()
-    FAILED = auto()
-    ROLLED_BACK = auto()
+    PENDING = 1
+    APPLIED = 2
+    FAILED = 3
+    ROLLED_BACK = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class Migration:
     """
     Represents a database migration.
@@ -52,17 +267,27 @@ class Migration:
         id: Unique migration identifier (usually timestamp + name).
         name: Human-readable migration name.
         up_sql: SQL to apply the migration.
-        down_sql: SQL to rollback the migration.
-        checksum: SHA256 hash of the migration content.
+        down: SQL to rollback the migration, or ``None`` if there is none.
+            Only passed to the constructor; read it back as ``down_sql``.
+        down_sql: SQL to rollback the migration. Migrations parsed from a
+            file read it from disk on first access, after checking it
+            against the checksum.
+        checksum: Hex digest of the migration content, used for drift
+            detection. xxHash3-64 when ``xxhash`` is installed, otherwise
+            SHA256; ``checksum_algo`` names the one used and is stored
+            with the checksum, so digests are only compared when the
+            algorithms match. Computed from ``up_sql`` and ``down``
+            (empty when ``None``) unless supplied by the caller.
         applied_at: When the migration was applied, if at all.
         status: Current status of the migration.
+        depends_on: IDs of migrations that must be applied first.
 
     Example:
         >>> migration = Migration(
         ...     id="20240115_001",
         ...     name="add_users_table",
         ...     up_sql="CREATE TABLE users (id SERIAL PRIMARY KEY);",
-        ...     down_sql="DROP TABLE users;"
+        ...     down="DROP TABLE users;"
         ... )
         >>> print(migration.checksum[:16])
         'a1b2c3d4e5f6g7h8'
@@ -71,15 +296,82 @@ class Migration:
     id: str
     name: str
     up_sql: str
-    down_sql: str
-    checksum: str = field(init=False)
+    down: InitVar[Optional[str]] = None
+    checksum: str = field(default="", kw_only=True)
     applied_at: Optional[datetime] = None
     status: MigrationStatus = MigrationStatus.PENDING
+    depends_on: List[str] = field(default_factory=list)
+    _down_sql: Optional[str] = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+    _source_path: Optional[Path] = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+    _down_span: Optional[Tuple[int, int]] = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+
+    checksum_algo: ClassVar[str] = "xxh3_64" if xxhash else "sha256"
+
+    def __post_init__(self, down: Optional[str]):
+        """Intern the ID and calculate checksum after initialization."""
+        self.id = sys.intern(self.id)
+        if down is not None:
+            self._down_sql = down
+        if self.checksum:
+            return
+        hasher = _new_hasher()
+        hasher.update(self.up_sql.encode())
+        hasher.update((down or "").encode())
+        self.checksum = hasher.hexdigest()
+
+    @property
+    def down_sql(self) -> str:
+        """
+        SQL to rollback the migration.
 
-    def __post_init__(self):
-        """Calculate checksum after initialization."""
-        content = f"{self.up_sql}{self.down_sql}"
-        self.checksum = hashlib.sha256(content.encode()).hexdigest()
+        For a migration parsed from a file, only the down section is read
+        on first access, and the checksum is verified before the SQL is
+        kept.
+
+        Raises:
+            MigrationError: If there is no rollback SQL, or the source
+                file cannot be read.
+            ChecksumMismatchError: If the file changed since discovery.
+        """
+        if self._down_sql is None:
+            if self._source_path is None:
+                raise MigrationError(
+                    f"Migration {self.id} has no rollback SQL",
+                    migration_id=self.id,
+                )
+
+            start, end = self._down_span
+            try:
+                with open(self._source_path, "rb") as f:
+                    f.seek(start)
+                    down = f.read(end - start)
+            except OSError as e:
+                raise MigrationError(
+                    f"Failed to read rollback SQL: {e}",
+                    migration_id=self.id,
+                    cause=e,
+                )
+
+            hasher = _new_hasher()
+            hasher.update(self.up_sql.encode())
+            hasher.update(down)
+            if hasher.hexdigest() != self.checksum:
+                raise ChecksumMismatchError(
+                    f"Migration {self.id} changed since it was discovered",
+                    migration_id=self.id,
+                )
+            self._down_sql = down.decode("utf-8")
+        return self._down_sql
+
+    @down_sql.setter
+    def down_sql(self, value: Optional[str]) -> None:
+        self._down_sql = value
 
 
 class DatabaseConnection(Protocol):
@@ -94,6 +386,11 @@ class DatabaseConnection(Protocol):
         begin_transaction: Start a new transaction.
         commit: Commit the current transaction.
         rollback: Rollback the current transaction.
+
+    Note:
+        Connections opened by ``connection_factory`` are closed with
+        ``close()``, if they provide one, when the runner's pool is
+        rebuilt.
     """
 
     def execute(self, sql: str, params: tuple = ()) -> None:
@@ -162,7 +459,7 @@ class ChecksumMismatchError(MigrationError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MigrationRunner:
     """
     Manages database migrations.
@@ -174,11 +471,22 @@ class MigrationRunner:
         connection_string: Database connection URL.
         migrations_dir: Path to migrations directory.
         table_name: Name of the migrations tracking table.
+        connection_factory: Opens additional pooled connections so
+            independent migrations can be applied concurrently. Without
+            it, the pool holds only ``connection`` and migrations are
+            applied one at a time.
+        max_workers: Maximum number of migrations applied concurrently,
+            and so the largest size the connection pool grows to.
+        pool_timeout: Seconds to wait for a free pooled connection.
 
     Attributes:
         connection: Active database connection.
-        migrations: List of all discovered migrations.
-        applied: Set of applied migration IDs.
+        migrations: Tuple of all known migrations, in ID order. Assign
+            a new list to replace them; the runner's lookup table and
+            pending queue are rebuilt on assignment.
+        applied: Frozen set of applied migration IDs. Assign any iterable
+            of IDs, such as those loaded from the tracking table, to
+            replace it; the runner's derived state is rebuilt on assignment.
 
     Example:
         Basic usage::
@@ -195,7 +503,14 @@ class MigrationRunner:
 
     Note:
         The runner creates a migrations tracking table automatically
-        on first use.
+        on first use, and adds the ``checksum_algo`` column to a table
+        created by an older version. Rows recorded before then are
+        marked ``sha256``, the only algorithm older versions used.
+
+        Checksums are xxHash3-64 when the optional ``xxhash`` package is
+        installed and SHA256 otherwise, so installing or removing it
+        changes every digest. ``checksum_algo`` records which one each
+        row was computed with.
 
     See Also:
         Migration: The migration data structure.
@@ -208,9 +523,72 @@ class MigrationRunner:
     connection_string: str
     migrations_dir: Path = field(default_factory=lambda: Path("./migrations"))
     table_name: str = "_migrations"
+    connection_factory: Optional[Callable[[], DatabaseConnection]] = None
+    max_workers: int = 4
+    pool_timeout: float = 30.0
     connection: Optional[DatabaseConnection] = field(default=None, init=False)
-    migrations: List[Migration] = field(default_factory=list, init=False)
-    applied: set = field(default_factory=set, init=False)
+    _migrations: List[Migration] = field(default_factory=list, init=False)
+    _applied: set = field(default_factory=set, init=False)
+    _applied_order: List[str] = field(default_factory=list, init=False, repr=False)
+    _by_id: Dict[str, Migration] = field(default_factory=dict, init=False, repr=False)
+    _pending: Deque[Migration] = field(default_factory=deque, init=False, repr=False)
+    _pool: "queue.Queue[DatabaseConnection]" = field(
+        default_factory=queue.Queue, init=False, repr=False
+    )
+    _pool_size: int = field(default=0, init=False, repr=False)
+    _pooled: Optional[DatabaseConnection] = field(
+        default=None, init=False, repr=False
+    )
+    _state_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _create_sql: str = field(init=False, repr=False)
+    _add_algo_sql: str = field(init=False, repr=False)
+    _insert_sql: str = field(init=False, repr=False)
+    _delete_sql: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Build the tracking-table statements once per runner."""
+        self._create_sql = (
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+            "id VARCHAR(255) PRIMARY KEY, "
+            "name VARCHAR(255) NOT NULL, "
+            "checksum VARCHAR(64) NOT NULL, "
+            "checksum_algo VARCHAR(16) NOT NULL DEFAULT 'sha256', "
+            "applied_at TIMESTAMP NOT NULL)"
+        )
+        self._add_algo_sql = (
+            f"ALTER TABLE {self.table_name} "
+            "ADD COLUMN checksum_algo VARCHAR(16) NOT NULL DEFAULT 'sha256'"
+        )
+        self._insert_sql = (
+            f"INSERT INTO {self.table_name} "
+            "(id, name, checksum, checksum_algo, applied_at) "
+            "VALUES (?, ?, ?, ?, ?)"
+        )
+        self._delete_sql = f"DELETE FROM {self.table_name} WHERE id = ?"
+
+    @property
+    def applied(self) -> frozenset:
+        """Read-only snapshot of the applied migration IDs."""
+        return frozenset(self._applied)
+
+    @applied.setter
+    def applied(self, ids: Iterable[str]) -> None:
+        self._applied = set(ids)
+        self._applied_order = sorted(self._applied)
+        self._refresh_pending()
+
+    @property
+    def migrations(self) -> Tuple[Migration, ...]:
+        """Read-only snapshot of the known migrations."""
+        return tuple(self._migrations)
+
+    @migrations.setter
+    def migrations(self, migrations: Iterable[Migration]) -> None:
+        self._migrations = sorted(migrations, key=lambda m: m.id)
+        self._by_id = {m.id: m for m in self._migrations}
+        self._refresh_pending()
 
     @classmethod
     def from_config(cls, config_path: str) -> "MigrationRunner":
@@ -241,6 +619,9 @@ class MigrationRunner:
         into Migration objects. Files must follow the naming convention:
         ``YYYYMMDD_NNN_name.sql``
 
+        Large directories are parsed across a process pool, since each
+        file is read and hashed independently.
+
         Args:
             path: Optional override for migrations directory.
 
@@ -264,18 +645,38 @@ class MigrationRunner:
         if not search_path.exists():
             raise FileNotFoundError(f"Migrations directory not found: {search_path}")
 
-        migrations = []
-        for file in sorted(search_path.glob("*.sql")):
-            migration = self._parse_migration_file(file)
-            migrations.append(migration)
+        with os.scandir(search_path) as it:
+            entries = [e for e in it if e.name.endswith(".sql") and e.is_file()]
+        entries.sort(key=lambda e: e.name)
+
+        files = [Path(e.path) for e in entries]
+        if len(files) < _PARALLEL_PARSE_THRESHOLD:
+            migrations = [self._parse_migration_file(file) for file in files]
+        else:
+            with ProcessPoolExecutor() as pool:
+                migrations = list(
+                    pool.map(self._parse_migration_file, files, chunksize=16)
+                )
+            # Unpickled IDs are fresh strings; re-intern them.
+            for migration in migrations:
+                migration.id = sys.intern(migration.id)
 
         self.migrations = migrations
         return migrations
 
-    def _parse_migration_file(self, path: Path) -> Migration:
+    @staticmethod
+    def _parse_migration_file(path: Path) -> Migration:
         """
         Parse a migration file into a Migration object.
 
+        The file is memory-mapped so the separator search and checksum
+        run over the raw bytes. Only the up section is decoded; the down
+        section is read again when ``Migration.down_sql`` is first used.
+        The first ``-- DOWN --`` outside quotes and comments separates the
+        sections, or the first one anywhere if all are quoted.
+        A ``-- DEPENDS: id1, id2`` line in the header declares migrations
+        that must be applied first.
+
         Args:
             path: Path to the migration file.
 
@@ -285,19 +686,41 @@ class MigrationRunner:
         Raises:
             ValueError: If file format is invalid or missing sections.
         """
-        content = path.read_text()
-        parts = content.split("-- DOWN --")
-
-        if len(parts) != 2:
-            raise ValueError(f"Migration {path.name} missing '-- DOWN --' separator")
+        error = f"Migration {path.name} missing '-- DOWN --' separator"
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(error)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                split = _find_down_marker(mm)
+                if split == -1:
+                    raise ValueError(error)
+                down_from = split + len(_DOWN_MARKER)
+
+                up_start, up_end = _strip_bounds(mm, 0, split)
+                down_start, down_end = _strip_bounds(mm, down_from, len(mm))
+
+                with memoryview(mm) as view:
+                    with view[up_start:up_end] as up, view[down_start:down_end] as down:
+                        hasher = _new_hasher()
+                        hasher.update(up)
+                        hasher.update(down)
+                        up_sql = str(up, "utf-8")
 
         return Migration(
             id=path.stem,
             name=path.stem.split("_", 2)[-1] if "_" in path.stem else path.stem,
-            up_sql=parts[0].strip(),
-            down_sql=parts[1].strip(),
+            up_sql=up_sql,
+            checksum=hasher.hexdigest(),
+            depends_on=_parse_depends(up_sql),
+            _source_path=path.resolve(),
+            _down_span=(down_start, down_end),
         )
 
+    def _refresh_pending(self) -> None:
+        """Rebuild the queue of unapplied migrations, in ID order."""
+        self._pending = deque(m for m in self._migrations if m.id not in self._applied)
+
     def run_pending(
         self, 
         callback: Optional[Callable[[Migration], None]] = None
@@ -305,6 +728,13 @@ class MigrationRunner:
         """
         Apply all pending migrations.
 
+        Migrations are applied in dependency groups. Every migration in a
+        group has its dependencies already applied, so when a
+        ``connection_factory`` is configured the group is applied
+        concurrently, one connection per worker. Only migrations that
+        declare ``-- DEPENDS:`` can share a group; the rest apply in ID
+        order.
+
         Args:
             callback: Optional function called after each migration.
 
@@ -322,40 +752,212 @@ class MigrationRunner:
             Applied: add_users_table
             Applied: add_indexes
         """
+        if not self._pending:
+            return []
+
+        self._ensure_pool()
         applied = []
-        pending = [m for m in self.migrations if m.id not in self.applied]
+        try:
+            for group in self._plan_groups(self._pending):
+                self._apply_group(group, applied, callback)
+        finally:
+            self._pending = deque(m for m in self._pending if m.id not in self._applied)
+
+        return applied
 
+    def _plan_groups(self, pending: Iterable[Migration]) -> List[List[Migration]]:
+        """
+        Order pending migrations into groups that can be applied together.
+
+        Only migrations with a ``-- DEPENDS:`` header are ordered by their
+        declared dependencies. A migration without one implicitly depends
+        on the pending migration just before it in ID order, so existing
+        migration sets keep applying strictly one after another. When no
+        pending migration declares dependencies, the common case, that
+        order is returned directly without building a graph.
+
+        Otherwise each run of consecutive header-less migrations becomes
+        a single chain node, so the graph only grows with the number of
+        migrations that declare dependencies. A dependency on any member
+        of a run waits for the whole run. Kahn's algorithm, with a heap
+        keyed by ID, yields the ID order except where a dependency forces
+        a change. Consecutive nodes that do not depend on each other
+        share a group.
+
+        Args:
+            pending: Migrations not yet applied, in ID order.
+
+        Returns:
+            Groups of migrations, in the order they must be applied.
+
+        Raises:
+            MigrationError: If a dependency is unknown or cyclic.
+        """
+        pending = list(pending)
+        if not any(m.depends_on for m in pending):
+            return [[m] for m in pending]
+
+        # Nodes are keyed by the ID of their first migration.
+        nodes: Dict[str, List[Migration]] = {}
+        node_of: Dict[str, str] = {}
+        key = None
         for migration in pending:
-            self._apply_migration(migration)
+            if key is None or migration.depends_on or nodes[key][0].depends_on:
+                key = migration.id
+                nodes[key] = []
+            nodes[key].append(migration)
+            node_of[migration.id] = key
+
+        deps_of: Dict[str, List[str]] = {}
+        dependents: Dict[str, List[str]] = {}
+        previous = None
+
+        for key, members in nodes.items():
+            head = members[0]
+            if head.depends_on:
+                deps = []
+                for dep in head.depends_on:
+                    if dep in node_of:
+                        deps.append(node_of[dep])
+                    elif dep not in self._by_id and dep not in self._applied:
+                        raise MigrationError(
+                            f"Unknown dependency: {dep}", migration_id=head.id
+                        )
+            else:
+                deps = [previous] if previous else []
+            for dep in deps:
+                dependents.setdefault(dep, []).append(key)
+            deps_of[key] = deps
+            previous = key
+
+        indegree = {key: len(deps) for key, deps in deps_of.items()}
+        ready = [key for key, count in indegree.items() if count == 0]
+        heapq.heapify(ready)
+        groups: List[List[Migration]] = []
+        group_keys: set = set()
+
+        while ready:
+            key = heapq.heappop(ready)
+            members = nodes[key]
+            if not groups or group_keys.intersection(deps_of[key]):
+                groups.append([])
+                group_keys = set()
+            groups[-1].append(members[0])
+            if len(members) > 1:
+                groups.extend([m] for m in members[1:])
+                group_keys = set()
+            group_keys.add(key)
+            for child in dependents.get(key, ()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    heapq.heappush(ready, child)
+
+        if sum(len(group) for group in groups) != len(pending):
+            cyclic = min(key for key, count in indegree.items() if count)
+            raise MigrationError("Dependency cycle detected", migration_id=cyclic)
+        return groups
+
+    def _apply_group(
+        self,
+        group: List[Migration],
+        applied: List[Migration],
+        callback: Optional[Callable[[Migration], None]] = None,
+    ) -> None:
+        """
+        Apply a group of mutually independent migrations.
+
+        Args:
+            group: Migrations whose dependencies are all applied.
+            applied: List to append the successfully applied migrations to.
+            callback: Optional function called for each applied migration.
+
+        Raises:
+            MigrationError: If any migration in the group fails. The rest
+                of the group is still attempted when applied concurrently.
+                Other exceptions are wrapped in a ``MigrationError``.
+
+        Note:
+            Migrations that succeeded are reported through ``applied`` and
+            ``callback`` even if another migration in the group failed.
+        """
+        workers = min(len(group), self.max_workers)
+        error = None
+        try:
+            if workers < 2 or self.connection_factory is None:
+                apply = self._apply_migration
+                with self._connection_ctx() as connection:
+                    for migration in group:
+                        apply(migration, connection)
+            else:
+                while self._pool_size < workers:
+                    self._pool.put(self.connection_factory())
+                    self._pool_size += 1
+
+                lanes = [group[i::workers] for i in range(workers)]
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(self._apply_lane, lane) for lane in lanes]
+                errors = [e for e in (f.exception() for f in futures) if e]
+                if errors:
+                    error = min(
+                        errors, key=lambda e: getattr(e, "migration_id", None) or ""
+                    )
+        except Exception as e:
+            error = e
+
+        if error is not None and not isinstance(error, MigrationError):
+            # E.g. ``rollback()`` itself failed inside _apply_migration.
+            error = MigrationError(f"Failed to apply migrations: {error}", cause=error)
+
+        for migration in group:
+            if migration.status != MigrationStatus.APPLIED:
+                continue
             applied.append(migration)
             if callback:
                 callback(migration)
-
-        return applied
-
-    def _apply_migration(self, migration: Migration) -> None:
+        if error:
+            raise error
+
+    def _apply_lane(self, lane: List[Migration]) -> None:
+        """Apply migrations one after another on a pooled connection."""
+        error = None
+        apply = self._apply_migration
+        with self._connection_ctx() as connection:
+            for migration in lane:
+                try:
+                    apply(migration, connection)
+                except MigrationError as e:
+                    error = error or e
+        if error:
+            raise error
+
+    def _apply_migration(
+        self, migration: Migration, connection: DatabaseConnection
+    ) -> None:
         """
         Apply a single migration.
 
+        The migration and its tracking-table row are committed in the
+        same transaction.
+
         Args:
             migration: Migration to apply.
+            connection: Pooled connection to apply it on.
 
         Raises:
             MigrationError: If migration fails.
         """
-        if not self.connection:
-            raise MigrationError("Not connected to database")
-
         try:
-            self.connection.begin_transaction()
-            self.connection.execute(migration.up_sql)
-            self._record_migration(migration)
-            self.connection.commit()
+            connection.begin_transaction()
+            connection.execute(migration.up_sql)
+            applied_at = self._record_migration(migration, connection)
+            connection.commit()
             migration.status = MigrationStatus.APPLIED
-            migration.applied_at = datetime.now()
-            self.applied.add(migration.id)
+            migration.applied_at = applied_at
+            with self._state_lock:
+                self._applied.add(migration.id)
+                bisect.insort(self._applied_order, migration.id)
         except Exception as e:
-            self.connection.rollback()
+            connection.rollback()
             migration.status = MigrationStatus.FAILED
             raise MigrationError(
                 f"Failed to apply migration: {e}",
@@ -363,16 +965,22 @@ class MigrationRunner:
                 cause=e,
             )
 
-    def _record_migration(self, migration: Migration) -> None:
-        """Record a migration in the tracking table."""
-        sql = f"""
-            INSERT INTO {self.table_name} (id, name, checksum, applied_at)
-            VALUES (?, ?, ?, ?)
-        """
-        self.connection.execute(
-            sql,
-            (migration.id, migration.name, migration.checksum, datetime.now()),
+    def _record_migration(
+        self, migration: Migration, connection: DatabaseConnection
+    ) -> datetime:
+        """Record a migration in the tracking table and return its timestamp."""
+        applied_at = datetime.now()
+        connection.execute(
+            self._insert_sql,
+            (
+                migration.id,
+                migration.name,
+                migration.checksum,
+                migration.checksum_algo,
+                applied_at,
+            ),
         )
+        return applied_at
 
     def rollback_last(self) -> Optional[Migration]:
         """
@@ -387,41 +995,135 @@ class MigrationRunner:
         Warning:
             Use with caution in production environments!
         """
-        if not self.applied:
+        if not self._applied_order:
             return None
 
-        last_id = max(self.applied)
-        migration = next((m for m in self.migrations if m.id == last_id), None)
+        migration = self._by_id.get(self._applied_order[-1])
 
         if migration:
+            self._ensure_pool()
             self._rollback_migration(migration)
             return migration
         return None
 
     def _rollback_migration(self, migration: Migration) -> None:
         """Rollback a single migration."""
+        down_sql = migration.down_sql
+        with self._connection_ctx() as connection:
+            try:
+                connection.begin_transaction()
+                connection.execute(down_sql)
+                self._remove_migration_record(migration, connection)
+                connection.commit()
+                migration.status = MigrationStatus.ROLLED_BACK
+                self._forget_applied(migration.id)
+                self._refresh_pending()
+            except Exception as e:
+                connection.rollback()
+                raise MigrationError(
+                    f"Failed to rollback migration: {e}",
+                    migration_id=migration.id,
+                    cause=e,
+                )
+
+    def _forget_applied(self, migration_id: str) -> None:
+        """Drop a migration ID from the in-memory applied state."""
+        self._applied.discard(migration_id)
+        order = self._applied_order
+        index = bisect.bisect_left(order, migration_id)
+        if index < len(order) and order[index] == migration_id:
+            del order[index]
+
+    def _remove_migration_record(
+        self, migration: Migration, connection: DatabaseConnection
+    ) -> None:
+        """Remove a migration from the tracking table."""
+        connection.execute(self._delete_sql, (migration.id,))
+
+    def _ensure_pool(self) -> None:
+        """
+        Make sure the connection pool holds the current ``connection``.
+
+        The pool is rebuilt if ``connection`` was replaced since it was
+        last seeded, and the tracking table is checked on the new
+        connection. Connections the factory opened for the old pool are
+        closed.
+
+        Raises:
+            MigrationError: If the runner is not connected, or the
+                tracking table cannot be created.
+        """
         if not self.connection:
             raise MigrationError("Not connected to database")
+        if self._pooled is not self.connection:
+            self._ensure_tracking_table(self.connection)
+            self._close_pooled()
+            self._pool = queue.Queue()
+            self._pool.put(self.connection)
+            self._pool_size = 1
+            self._pooled = self.connection
+
+    def _close_pooled(self) -> None:
+        """Drain the pool, closing connections opened by the factory."""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            close = getattr(connection, "close", None)
+            if connection is not self._pooled and close:
+                close()
+
+    def _ensure_tracking_table(self, connection: DatabaseConnection) -> None:
+        """
+        Create the tracking table, or add ``checksum_algo`` to an old one.
 
+        Args:
+            connection: Connection to run the DDL on.
+
+        Raises:
+            MigrationError: If the table cannot be created.
+        """
         try:
-            self.connection.begin_transaction()
-            self.connection.execute(migration.down_sql)
-            self._remove_migration_record(migration)
-            self.connection.commit()
-            migration.status = MigrationStatus.ROLLED_BACK
-            self.applied.discard(migration.id)
+            connection.begin_transaction()
+            connection.execute(self._create_sql)
+            connection.commit()
         except Exception as e:
-            self.connection.rollback()
+            connection.rollback()
             raise MigrationError(
-                f"Failed to rollback migration: {e}",
-                migration_id=migration.id,
+                f"Failed to create tracking table: {e}",
                 cause=e,
             )
 
-    def _remove_migration_record(self, migration: Migration) -> None:
-        """Remove a migration from the tracking table."""
-        sql = f"DELETE FROM {self.table_name} WHERE id = ?"
-        self.connection.execute(sql, (migration.id,))
+        # The connection protocol cannot inspect columns, so try the ALTER
+        # and treat failure as the column already existing. Any other
+        # problem still surfaces when the first row is recorded.
+        try:
+            connection.begin_transaction()
+            connection.execute(self._add_algo_sql)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+
+    @contextmanager
+    def _connection_ctx(self) -> Iterator[DatabaseConnection]:
+        """
+        Borrow a pooled connection for the duration of the block.
+
+        Raises:
+            MigrationError: If no connection frees up within
+                ``pool_timeout`` seconds.
+        """
+        try:
+            connection = self._pool.get(timeout=self.pool_timeout)
+        except queue.Empty:
+            raise MigrationError(
+                f"No pooled connection available after {self.pool_timeout}s"
+            )
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
 
     def status(self) -> dict:
         """
@@ -440,8 +1142,8 @@ class MigrationRunner:
             Pending: 3
         """
         return {
-            "total": len(self.migrations),
-            "applied": len(self.applied),
-            "pending": len(self.migrations) - len(self.applied),
-            "last_applied": max(self.applied) if self.applied else None,
+            "total": len(self._migrations),
+            "applied": len(self._applied),
+            "pending": len(self._migrations) - len(self._applied),
+            "last_applied": self._applied_order[-1] if self._applied_order else None,
         }